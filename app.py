@@ -1,12 +1,9 @@
 
 import math
-from datetime import date, timedelta
-from dateutil.relativedelta import relativedelta
+from datetime import date
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
 st.set_page_config(page_title="Interactive Loan Calculator", page_icon="💸", layout="wide")
@@ -16,66 +13,79 @@ st.set_page_config(page_title="Interactive Loan Calculator", page_icon="💸", l
 # -----------------------------
 with st.sidebar:
     st.title("💸 Loan Calculator")
-    st.caption("Play with inputs and instantly see graphs, tables, and summaries.")
-
-    # Borrower details
-    st.subheader("Borrower")
-    name = st.text_input("Name", value="Alex Doe", help="For personalization in the report.")
-    age = st.number_input("Age", min_value=0, max_value=120, value=30)
-    region = st.text_input("Country/Region (optional)", value="")
-
-    # Loan basics
-    st.subheader("Loan Details")
-    purchase_price = st.number_input("Purchase Price (optional)", min_value=0.0, value=500000.0, step=1000.0, format="%.2f")
-    deposit = st.number_input("Deposit / Down Payment", min_value=0.0, value=100000.0, step=1000.0, format="%.2f")
-    principal = st.number_input("Loan Amount (principal)", min_value=0.0, value=max(0.0, purchase_price - deposit), step=1000.0, format="%.2f")
-    apr = st.number_input("Annual Interest Rate (APR, %)", min_value=0.0, max_value=100.0, value=7.5, step=0.05, format="%.2f") / 100.0
-
-    loan_years = st.slider("Duration (years)", min_value=1, max_value=40, value=25, help="Total term length")
-
-    comp_map = {"Monthly (12)": 12, "Quarterly (4)": 4, "Biannual (2)": 2, "Annual (1)": 1}
-    comp_choice = st.selectbox("Compounding frequency", list(comp_map.keys()), index=0)
-    comp_per_year = comp_map[comp_choice]
-
-    payfreq_map = {"Monthly (12)": 12, "Biweekly (26)": 26, "Weekly (52)": 52}
-    pay_choice = st.selectbox("Repayment frequency", list(payfreq_map.keys()), index=0)
-    pay_per_year = payfreq_map[pay_choice]
-
-    start_date = st.date_input("First Payment Date", value=date.today())
-
-    st.subheader("Advanced Options")
-    extra_payment = st.slider("Extra Payment per period", min_value=0.0, max_value=20000.0, value=0.0, step=100.0)
-    interest_only_toggle = st.toggle("Interest-only period?")
-    io_months = 0
-    if interest_only_toggle:
-        if pay_per_year == 12:
-            io_months = st.number_input("Interest-only Months", min_value=1, max_value=60, value=12, step=1)
-        else:
-            st.info("Interest-only period is applied in **months** and converted to your payment frequency.")
-            io_months = st.number_input("Interest-only Months", min_value=1, max_value=60, value=12, step=1)
-
-    fees_checked = st.checkbox("Include one-time fees (origination, closing)")
-    one_time_fees = 0.0
-    roll_fees = False
-    if fees_checked:
-        one_time_fees = st.number_input("One-time Fees (total)", min_value=0.0, value=0.0, step=100.0)
-        roll_fees = st.checkbox("Roll fees into the loan (increase principal)", value=True)
-
-    escrow_toggle = st.toggle("Add monthly escrow (tax/insurance/HOA)")
-    escrow_amount = 0.0
-    if escrow_toggle:
-        escrow_amount = st.number_input("Escrow amount per month", min_value=0.0, value=0.0, step=50.0)
-
-    inflation_checked = st.checkbox("Adjust with expected inflation (for informational charts)")
-    inflation_rate = 0.0
-    if inflation_checked:
-        inflation_rate = st.number_input("Expected Annual Inflation (%)", min_value=0.0, max_value=50.0, value=3.0, step=0.1) / 100.0
-
+    st.caption("Play with inputs and press **Compute** to see graphs, tables, and summaries.")
+
+    # Batch input changes: the script reruns once per Compute, not once per widget
+    with st.form("loan_inputs"):
+        # Borrower details
+        st.subheader("Borrower")
+        name = st.text_input("Name", value="Alex Doe", help="For personalization in the report.")
+        age = st.number_input("Age", min_value=0, max_value=120, value=30)
+        region = st.text_input("Country/Region (optional)", value="")
+
+        # Loan basics
+        st.subheader("Loan Details")
+        purchase_price = st.number_input("Purchase Price (optional)", min_value=0.0, value=500000.0, step=1000.0, format="%.2f")
+        deposit = st.number_input("Deposit / Down Payment", min_value=0.0, value=100000.0, step=1000.0, format="%.2f")
+        # Stable key so an edited loan amount survives a submit that also changes price/deposit;
+        # the amount only follows price - deposit while it still equals the last suggested value
+        suggested_principal = max(0.0, purchase_price - deposit)
+        last_suggested = st.session_state.get("suggested_principal")
+        if "principal" not in st.session_state or (suggested_principal != last_suggested and st.session_state["principal"] == last_suggested):
+            st.session_state["principal"] = suggested_principal
+        st.session_state["suggested_principal"] = suggested_principal
+        principal = st.number_input("Loan Amount (principal)", min_value=0.0, step=1000.0, format="%.2f", key="principal")
+        apr = st.number_input("Annual Interest Rate (APR, %)", min_value=0.0, max_value=100.0, value=7.5, step=0.05, format="%.2f") / 100.0
+
+        loan_years = st.slider("Duration (years)", min_value=1, max_value=40, value=25, help="Total term length")
+
+        comp_map = {"Monthly (12)": 12, "Quarterly (4)": 4, "Biannual (2)": 2, "Annual (1)": 1}
+        comp_choice = st.selectbox("Compounding frequency", list(comp_map.keys()), index=0)
+        comp_per_year = comp_map[comp_choice]
+
+        payfreq_map = {"Monthly (12)": 12, "Biweekly (26)": 26, "Weekly (52)": 52}
+        payfreq_inv = {v: k for k, v in payfreq_map.items()}
+        pay_choice = st.selectbox("Repayment frequency", list(payfreq_map.keys()), index=0)
+        pay_per_year = payfreq_map[pay_choice]
+
+        start_date = st.date_input("First Payment Date", value=date.today())
+
+        st.subheader("Advanced Options")
+        extra_payment = st.slider("Extra Payment per period", min_value=0.0, max_value=20000.0, value=0.0, step=100.0)
+        # Dependent fields are always shown: widgets inside a form don't rerun on change, so
+        # fields revealed by a toggle would otherwise be applied at unseen defaults on Compute
+        interest_only_toggle = st.toggle("Interest-only period?")
+        io_months_input = st.number_input("Interest-only Months", min_value=1, max_value=60, value=12, step=1,
+                                          help="Applied in months and converted to your payment frequency. Used when the toggle above is on.")
+        io_months = io_months_input if interest_only_toggle else 0
+
+        fees_checked = st.checkbox("Include one-time fees (origination, closing)")
+        fees_input = st.number_input("One-time Fees (total)", min_value=0.0, value=0.0, step=100.0, help="Used when the checkbox above is ticked.")
+        roll_fees_input = st.checkbox("Roll fees into the loan (increase principal)", value=True)
+        one_time_fees = fees_input if fees_checked else 0.0
+        roll_fees = roll_fees_input if fees_checked else False
+
+        escrow_toggle = st.toggle("Add monthly escrow (tax/insurance/HOA)")
+        escrow_input = st.number_input("Escrow amount per month", min_value=0.0, value=0.0, step=50.0, help="Used when the toggle above is on.")
+        escrow_amount = escrow_input if escrow_toggle else 0.0
+
+        inflation_checked = st.checkbox("Adjust with expected inflation (for informational charts)")
+        inflation_input = st.number_input("Expected Annual Inflation (%)", min_value=0.0, max_value=50.0, value=3.0, step=0.1,
+                                          help="Used when the checkbox above is ticked.") / 100.0
+        inflation_rate = inflation_input if inflation_checked else 0.0
+
+        submitted = st.form_submit_button("Compute", type="primary", use_container_width=True)
+
+    show_charts = st.checkbox("Show charts", value=True)
     show_table = st.checkbox("Show full amortization table", value=True)
 
 # -----------------------------
 # Helper functions
 # -----------------------------
+# Date step between payments; fixed-length steps rather than the anchored 'MS'/'W' aliases
+# so every payment stays on the weekday/day-of-month of the first payment date
+payfreq_offsets = {12: pd.DateOffset(months=1), 26: "14D", 52: "7D"}
+
 def periodic_rate_from_apr(apr: float, comp_per_year: int, pay_per_year: int) -> float:
     """Convert APR with compounding 'comp_per_year' to an effective per-payment rate"""
     ear = (1 + apr/comp_per_year) ** comp_per_year - 1  # effective annual rate
@@ -88,6 +98,34 @@ def pmt(rate, nper, pv):
         return pv / nper
     return (rate * pv) / (1 - (1 + rate) ** (-nper))
 
+def payoff_periods(rate, payment, pv, tol=1e-6):
+    """Number of level payments needed to bring balance 'pv' down to 'tol' (inf if never)."""
+    if pv <= tol:
+        return 0
+    if payment <= pv * rate or payment <= 0:
+        return math.inf
+    if rate == 0:
+        return math.ceil((pv - tol) / payment)
+    return math.ceil(math.log((payment - rate * tol) / (payment - rate * pv)) / math.log1p(rate))
+
+def balance_path(rate, payment, pv, max_periods):
+    """Closing balance after each level payment, zeroed at payoff (closed form of bal*(1+rate) - payment)."""
+    # One spare period absorbs rounding in the log; trim back to the first paid-off period
+    n = payoff_periods(rate, payment, pv)
+    n = min(n + 1 if n else 0, max_periods)
+    k = np.arange(1, n + 1)
+    if rate == 0:
+        closing = pv - payment * k
+    else:
+        closing = (pv - payment / rate) * (1 + rate) ** k + payment / rate
+    # Closed form carries float noise proportional to the balance, so allow for it when detecting payoff
+    paid_off = np.flatnonzero(closing <= max(1e-6, 1e-9 * pv))
+    if len(paid_off):
+        closing = closing[:paid_off[0] + 1]
+        closing[-1] = 0.0
+    return closing
+
+@st.cache_data(max_entries=32, show_spinner=False)
 def build_schedule(principal: float,
                    apr: float,
                    years: int,
@@ -99,8 +137,8 @@ def build_schedule(principal: float,
                    escrow_monthly: float = 0.0,
                    inflation_rate: float = 0.0,
                    roll_fees: bool = False,
-                   fees: float = 0.0) -> pd.DataFrame:
-    """Return amortization schedule DataFrame."""
+                   fees: float = 0.0) -> tuple[pd.DataFrame, dict]:
+    """Return amortization schedule DataFrame and summary totals (cached per set of inputs)."""
     # Optionally roll fees into principal
     pv = principal + (fees if roll_fees else 0.0)
 
@@ -111,111 +149,126 @@ def build_schedule(principal: float,
     # Convert IO months to number of payments (approximate via monthly->periods)
     io_periods = int(round(io_months * pay_per_year / 12))
 
-    # Build schedule iteratively
-    bal = pv
-    rows = []
-    current_date = start_date
-
-    # Helper for advancing date by payment frequency
-    def advance_date(d: date) -> date:
-        if pay_per_year == 12:
-            return d + relativedelta(months=+1)
-        elif pay_per_year == 26:
-            return d + timedelta(days=14)
-        elif pay_per_year == 52:
-            return d + timedelta(days=7)
-        else:
-            return d + relativedelta(months=+1)
-
     escrow_per_period = escrow_monthly * (12 / pay_per_year) if escrow_monthly else 0.0
 
-    i = 0
-    total_interest = 0.0
-    total_principal = 0.0
-    total_payment = 0.0
-    total_escrow = 0.0
-    total_extra = 0.0
-
-    while bal > 1e-6 and i < nper + 6000:
-        interest = bal * rate
-        if i < io_periods:
-            scheduled_principal = 0.0
-            scheduled_payment = interest
-        else:
-            scheduled_payment = base_payment
-            scheduled_principal = scheduled_payment - interest
-            if scheduled_principal < 0:
-                scheduled_principal = 0.0
-
-        extra = extra_payment
-        if scheduled_principal + extra > bal:
-            extra = max(0.0, bal - scheduled_principal)
-
-        principal_component = scheduled_principal + extra
-        payment_component = scheduled_payment + extra
-
-        new_bal = bal - principal_component
-        if new_bal < 0:
-            payment_component += new_bal
-            principal_component += new_bal
-            new_bal = 0.0
-
-        inflation_per_period = (1 + inflation_rate) ** (1 / pay_per_year) - 1 if inflation_rate else 0.0
-        inflation_factor = (1 + inflation_per_period) ** i
-
-        rows.append({
-            "Period": i + 1,
-            "Date": current_date,
-            "Payment": round(payment_component, 8),
-            "Interest": round(interest, 8),
-            "Principal": round(principal_component, 8),
-            "Extra_Principal": round(extra, 8),
-            "Escrow": round(escrow_per_period, 8),
-            "Total_Outflow": round(payment_component + escrow_per_period, 8),
-            "Balance": round(new_bal, 8),
-            "Inflation_Adjusted_Payment": (payment_component / inflation_factor) if inflation_rate else None
-        })
-
-        total_interest += interest
-        total_principal += principal_component
-        total_payment += payment_component
-        total_escrow += escrow_per_period
-        total_extra += extra
-
-        bal = new_bal
-        current_date = advance_date(current_date)
-        i += 1
-
-    df = pd.DataFrame(rows)
+    # Closing balances, one phase at a time: interest-only periods only reduce the
+    # balance by the extra payment, amortizing periods by base payment + extra - interest.
+    max_periods = nper + 6000
+    io_closing = balance_path(0.0, extra_payment, pv, min(io_periods, max_periods))
+    am_start = io_closing[-1] if len(io_closing) else pv
+    am_closing = balance_path(rate, base_payment + extra_payment, am_start, max_periods - len(io_closing))
+    closing = np.concatenate((io_closing, am_closing))
+    n = len(closing)
+
+    opening = np.concatenate(([pv], closing[:-1]))[:n]
+    interest = opening * rate
+    is_io = np.arange(n) < len(io_closing)
+    scheduled_principal = np.where(is_io, 0.0, np.maximum(base_payment - interest, 0.0))
+    extra = np.clip(opening - scheduled_principal, 0.0, extra_payment)
+    principal_paid = opening - closing
+    payment = interest + principal_paid
+
+    # Deflate payments to today's money; skipped entirely when no inflation is set
+    inflation_adjusted = None
+    if inflation_rate:
+        inflation_per_period = (1 + inflation_rate) ** (1 / pay_per_year) - 1
+        inflation_adjusted = payment / np.power(1 + inflation_per_period, np.arange(n))
+
+    date_step = payfreq_offsets.get(pay_per_year, payfreq_offsets[12])
+    dates = pd.date_range(start=pd.Timestamp(start_date), periods=n, freq=date_step)
+
+    df = pd.DataFrame({
+        "Period": np.arange(1, n + 1, dtype=np.int32),
+        "Date": dates,
+        "Payment": payment,
+        "Interest": interest,
+        "Principal": principal_paid,
+        "Extra_Principal": extra,
+        "Escrow": escrow_per_period,
+        "Total_Outflow": payment + escrow_per_period,
+        "Balance": closing,
+        "Inflation_Adjusted_Payment": inflation_adjusted
+    }).round({"Payment": 8, "Interest": 8, "Principal": 8, "Extra_Principal": 8,
+              "Escrow": 8, "Total_Outflow": 8, "Balance": 8})
     meta = {
         "base_payment": base_payment,
         "periodic_rate": rate,
-        "n_periods": i,
-        "total_interest": total_interest,
-        "total_principal": total_principal,
-        "total_payment": total_payment,
-        "total_escrow": total_escrow,
-        "total_extra": total_extra,
+        "io_periods": io_periods,
+        "n_periods": n,
+        "total_interest": interest.sum(),
+        "total_principal": principal_paid.sum(),
+        "total_payment": payment.sum(),
+        "total_escrow": escrow_per_period * n,
+        "total_extra": extra.sum(),
         "rolled_fees": fees if roll_fees else 0.0,
         "fees_paid_upfront": fees if not roll_fees else 0.0
     }
     return df, meta
 
-# Build schedule
-schedule_df, meta = build_schedule(
-    principal=principal,
-    apr=apr,
-    years=loan_years,
-    comp_per_year=comp_per_year,
-    pay_per_year=pay_per_year,
-    start_date=start_date,
-    extra_payment=extra_payment,
-    io_months=io_months,
-    escrow_monthly=escrow_amount,
-    inflation_rate=inflation_rate,
-    roll_fees=roll_fees,
-    fees=one_time_fees
-)
+@st.cache_data(max_entries=32, show_spinner=False)
+def with_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Return schedule with running totals and the interest-to-principal ratio, added in one assign."""
+    return df.assign(Cum_Interest=df["Interest"].cumsum(),
+                     Cum_Principal=df["Principal"].cumsum(),
+                     Interest_to_Principal_Ratio=df["Interest"] / (df["Principal"] + 1e-9))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def yearly_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """Return schedule totals grouped by calendar year."""
+    return df.assign(Year=df["Date"].dt.year).groupby("Year").agg({
+        "Payment":"sum", "Interest":"sum", "Principal":"sum", "Extra_Principal":"sum",
+        "Escrow":"sum", "Total_Outflow":"sum"
+    }).reset_index()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def schedule_csv(df: pd.DataFrame) -> bytes:
+    """Serialize schedule for the CSV download button."""
+    return df.to_csv(index=False).encode("utf-8")
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def loan_report(name: str, age: int, region: str, principal: float, apr: float, loan_years: int,
+                pay_choice: str, comp_choice: str, meta: dict, generated_on: date) -> str:
+    """Return the Markdown summary report."""
+    return f"""
+# Loan Report for {name}
+
+- Age: {age}
+- Region: {region or '—'}
+
+## Loan Summary
+- Principal (Loan Amount): ${principal:,.2f}
+- APR: {apr*100:.2f}%
+- Term: {loan_years} years
+- Repayment Frequency: {pay_choice}
+- Compounding: {comp_choice}
+- Base Payment (per period): ${meta['base_payment']:,.2f}
+
+## Totals
+- Total Interest: ${meta['total_interest']:,.2f}
+- Total Principal: ${meta['total_principal']:,.2f}
+- Total Extra Principal: ${meta['total_extra']:,.2f}
+- Total Escrow: ${meta['total_escrow']:,.2f}
+
+*Generated on: {generated_on.isoformat()}*
+"""
+
+# Build schedule on submit (or first run); other reruns reuse the last result
+if submitted or "schedule" not in st.session_state:
+    st.session_state["schedule"] = build_schedule(
+        principal=principal,
+        apr=apr,
+        years=loan_years,
+        comp_per_year=comp_per_year,
+        pay_per_year=pay_per_year,
+        start_date=start_date,
+        extra_payment=extra_payment,
+        io_months=io_months,
+        escrow_monthly=escrow_amount,
+        inflation_rate=inflation_rate,
+        roll_fees=roll_fees,
+        fees=one_time_fees
+    )
+schedule_df, meta = st.session_state["schedule"]
 
 # -----------------------------
 # Top Summary Cards
@@ -229,7 +282,7 @@ with col2:
 with col3:
     st.metric("Term", f"{loan_years} years")
 with col4:
-    st.metric("Payments", f"{meta['n_periods']} ({list(payfreq_map.keys())[list(payfreq_map.values()).index(pay_per_year)]})")
+    st.metric("Payments", f"{meta['n_periods']} ({payfreq_inv[pay_per_year]})")
 
 col5, col6, col7, col8 = st.columns(4)
 with col5:
@@ -244,6 +297,17 @@ with col8:
 # -----------------------------
 # Charts
 # -----------------------------
+charts_hidden_msg = "Charts are hidden. Tick **Show charts** in the sidebar to see them."
+if show_charts:
+    # Plotly is only imported when charts are shown; with "Show charts" off it is never loaded
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    # Charts only need cents; short numbers keep the Plotly JSON sent to the browser small.
+    # Summary metrics keep using the full-precision totals in meta.
+    plot_df = schedule_df.round(2)
+    derived_df = with_derived_columns(schedule_df)
+
 tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
     "📉 Balance Over Time",
     "📊 Payment Breakdown",
@@ -255,79 +319,82 @@ tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
 ])
 
 with tab1:
-    fig_bal = px.line(schedule_df, x="Date", y="Balance", title="Outstanding Balance Over Time")
-    st.plotly_chart(fig_bal, use_container_width=True)
+    if show_charts:
+        fig_bal = px.line(plot_df, x="Date", y="Balance", title="Outstanding Balance Over Time")
+        st.plotly_chart(fig_bal, use_container_width=True)
+    else:
+        st.info(charts_hidden_msg)
 
 with tab2:
-    N = min(120, len(schedule_df))
-    small = schedule_df.head(N)
-    fig_bar = go.Figure()
-    fig_bar.add_trace(go.Bar(x=small["Date"], y=small["Interest"], name="Interest"))
-    fig_bar.add_trace(go.Bar(x=small["Date"], y=small["Principal"], name="Principal"))
-    fig_bar.add_trace(go.Bar(x=small["Date"], y=small["Extra_Principal"], name="Extra Principal"))
-    fig_bar.update_layout(barmode="stack", title=f"Payment Breakdown (first {N} periods)")
-    st.plotly_chart(fig_bar, use_container_width=True)
+    if show_charts:
+        N = min(120, len(plot_df))
+        small = plot_df.head(N)
+        fig_bar = go.Figure()
+        fig_bar.add_trace(go.Bar(x=small["Date"], y=small["Interest"], name="Interest"))
+        fig_bar.add_trace(go.Bar(x=small["Date"], y=small["Principal"], name="Principal"))
+        fig_bar.add_trace(go.Bar(x=small["Date"], y=small["Extra_Principal"], name="Extra Principal"))
+        fig_bar.update_layout(barmode="stack", title=f"Payment Breakdown (first {N} periods)")
+        st.plotly_chart(fig_bar, use_container_width=True)
+    else:
+        st.info(charts_hidden_msg)
 
 with tab3:
-    schedule_df["Cum_Interest"] = schedule_df["Interest"].cumsum()
-    schedule_df["Cum_Principal"] = schedule_df["Principal"].cumsum()
-    fig_cum = px.area(schedule_df, x="Date", y=["Cum_Principal", "Cum_Interest"], title="Cumulative Principal vs Interest")
-    st.plotly_chart(fig_cum, use_container_width=True)
+    if show_charts:
+        fig_cum = px.area(derived_df.round(2), x="Date", y=["Cum_Principal", "Cum_Interest"], title="Cumulative Principal vs Interest")
+        st.plotly_chart(fig_cum, use_container_width=True)
 
-    pie = go.Figure(data=[go.Pie(labels=["Total Principal", "Total Interest"], values=[meta["total_principal"], meta["total_interest"]])])
-    pie.update_layout(title="Total Cost Breakdown")
-    st.plotly_chart(pie, use_container_width=True)
+        pie = go.Figure(data=[go.Pie(labels=["Total Principal", "Total Interest"], values=[meta["total_principal"], meta["total_interest"]])])
+        pie.update_layout(title="Total Cost Breakdown")
+        st.plotly_chart(pie, use_container_width=True)
+    else:
+        st.info(charts_hidden_msg)
 
 with tab4:
     if len(schedule_df) > 0:
-        df_year = schedule_df.copy()
-        df_year["Year"] = pd.to_datetime(df_year["Date"]).dt.year
-        yearly = df_year.groupby("Year").agg({
-            "Payment":"sum", "Interest":"sum", "Principal":"sum", "Extra_Principal":"sum",
-            "Escrow":"sum", "Total_Outflow":"sum"
-        }).reset_index()
+        yearly = yearly_summary(schedule_df)
         st.dataframe(yearly, use_container_width=True)
-        fig_year = px.bar(yearly, x="Year", y=["Interest", "Principal", "Extra_Principal"], title="Yearly Payment Breakdown (Stacked)")
-        st.plotly_chart(fig_year, use_container_width=True)
+        if show_charts:
+            fig_year = px.bar(yearly, x="Year", y=["Interest", "Principal", "Extra_Principal"], title="Yearly Payment Breakdown (Stacked)")
+            st.plotly_chart(fig_year, use_container_width=True)
     else:
         st.info("No data to summarize.")
 
 with tab5:
-    schedule_df["Interest_to_Principal_Ratio"] = schedule_df["Interest"] / (schedule_df["Principal"] + 1e-9)
-    fig_ratio = px.line(schedule_df, x="Date", y="Interest_to_Principal_Ratio", title="Interest-to-Principal Payment Ratio Over Time")
-    st.plotly_chart(fig_ratio, use_container_width=True)
+    if show_charts:
+        fig_ratio = px.line(derived_df.round({"Interest_to_Principal_Ratio": 4}), x="Date", y="Interest_to_Principal_Ratio", title="Interest-to-Principal Payment Ratio Over Time")
+        st.plotly_chart(fig_ratio, use_container_width=True)
+    else:
+        st.info(charts_hidden_msg)
 
 with tab6:
-    if inflation_rate > 0:
-        valid = schedule_df.dropna(subset=["Inflation_Adjusted_Payment"])
+    if inflation_rate <= 0:
+        st.info("Enable inflation adjustment in sidebar to see this analysis.")
+    elif show_charts:
+        valid = plot_df.dropna(subset=["Inflation_Adjusted_Payment"])
         fig_infl = px.line(valid, x="Date", y="Inflation_Adjusted_Payment", title="Inflation-Adjusted Payments Over Time")
         st.plotly_chart(fig_infl, use_container_width=True)
     else:
-        st.info("Enable inflation adjustment in sidebar to see this analysis.")
+        st.info(charts_hidden_msg)
 
 with tab7:
-    alt_df, alt_meta = build_schedule(
-        principal=principal,
-        apr=apr,
-        years=loan_years,
-        comp_per_year=comp_per_year,
-        pay_per_year=pay_per_year,
-        start_date=start_date,
-        extra_payment=0.0,
-        io_months=io_months,
-        escrow_monthly=escrow_amount,
-        inflation_rate=inflation_rate,
-        roll_fees=roll_fees,
-        fees=one_time_fees
-    )
+    # Without extra payments the loan runs its full term: interest-only periods, then
+    # nper level payments, so the totals follow in closed form without a second schedule
+    loan_pv = principal + meta["rolled_fees"]
+    nper = loan_years * pay_per_year
+    alt_meta = {"total_interest": 0.0, "n_periods": 0}
+    if loan_pv > 0:
+        alt_meta["total_interest"] = meta["io_periods"] * meta["periodic_rate"] * loan_pv + meta["base_payment"] * nper - loan_pv
+        alt_meta["n_periods"] = meta["io_periods"] + nper
     compare = pd.DataFrame({
         "Scenario":["With Extra Payments","Without Extra Payments"],
         "Total Interest":[meta["total_interest"], alt_meta["total_interest"]],
         "Total Payments":[meta["n_periods"], alt_meta["n_periods"]]
     })
     st.dataframe(compare, use_container_width=True)
-    fig_comp = px.bar(compare, x="Scenario", y="Total Interest", title="Impact of Extra Payments on Total Interest")
-    st.plotly_chart(fig_comp, use_container_width=True)
+    if show_charts:
+        fig_comp = go.Figure(go.Bar(x=["With Extra Payments", "Without Extra Payments"], y=[meta["total_interest"], alt_meta["total_interest"]]))
+        fig_comp.update_layout(title="Impact of Extra Payments on Total Interest", xaxis_title="Scenario", yaxis_title="Total Interest")
+        st.plotly_chart(fig_comp, use_container_width=True)
 
 # -----------------------------
 # Tables
@@ -346,35 +413,20 @@ st.dataframe(summary_df, use_container_width=True, hide_index=True)
 
 if show_table:
     st.subheader("📅 Full Amortization Schedule")
-    st.dataframe(schedule_df, use_container_width=True)
+    # Send one page of rows to the browser at a time; the CSV download has the full schedule
+    rows_per_page = 50
+    n_pages = max(1, math.ceil(len(schedule_df) / rows_per_page))
+    page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1)
+    page_start = (page - 1) * rows_per_page
+    st.dataframe(schedule_df.iloc[page_start:page_start + rows_per_page], use_container_width=True)
+    st.caption(f"Showing periods {min(page_start + 1, len(schedule_df))}–{min(page_start + rows_per_page, len(schedule_df))} of {len(schedule_df)}.")
 
 # -----------------------------
 # Download options
 # -----------------------------
-st.download_button("⬇️ Download Amortization Schedule (CSV)", data=schedule_df.to_csv(index=False), file_name="amortization_schedule.csv", mime="text/csv")
+st.download_button("⬇️ Download Amortization Schedule (CSV)", data=schedule_csv(schedule_df), file_name="amortization_schedule.csv", mime="text/csv")
 
-report = f"""
-# Loan Report for {name}
-
-- Age: {age}
-- Region: {region or '—'}
-
-## Loan Summary
-- Principal (Loan Amount): ${principal:,.2f}
-- APR: {apr*100:.2f}%
-- Term: {loan_years} years
-- Repayment Frequency: {pay_choice}
-- Compounding: {comp_choice}
-- Base Payment (per period): ${meta['base_payment']:,.2f}
-
-## Totals
-- Total Interest: ${meta['total_interest']:,.2f}
-- Total Principal: ${meta['total_principal']:,.2f}
-- Total Extra Principal: ${meta['total_extra']:,.2f}
-- Total Escrow: ${meta['total_escrow']:,.2f}
-
-*Generated on: {date.today().isoformat()}*
-"""
+report = loan_report(name, age, region, principal, apr, loan_years, pay_choice, comp_choice, meta, date.today())
 st.download_button("⬇️ Download Summary Report (Markdown)", data=report, file_name="loan_report.md", mime="text/markdown")
 
 st.caption("Built with ❤️ using Streamlit, Plotly, NumPy, and Pandas.")